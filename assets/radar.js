@@ -0,0 +1,62 @@
+// Builds the radar chart in the browser from the normalized values the server
+// stores in `player-json`, so changing the stats dropdown needs no round trip.
+(function() {
+    function messageFigure(text, font) {
+        return {
+            data: [],
+            layout: {
+                annotations: [{text: text, showarrow: false, font: font, xref: 'paper', yref: 'paper', x: 0.5, y: 0.5}],
+                xaxis: {visible: false},
+                yaxis: {visible: false},
+                plot_bgcolor: 'rgba(0,0,0,0)',
+                paper_bgcolor: 'rgba(0,0,0,0)'
+            }
+        };
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        radar: {
+            build: function(playerJson, selectedStats) {
+                if (!playerJson) {
+                    return messageFigure('No data available', {size: 16, color: '#6b7280'});
+                }
+
+                var stats = selectedStats && selectedStats.length ? selectedStats : playerJson.defaultStats;
+                var categories = stats.filter(function(stat) { return stat in playerJson.values; });
+                if (!categories.length) {
+                    return messageFigure('No valid stats for radar chart');
+                }
+
+                return {
+                    data: [{
+                        type: 'scatterpolar',
+                        r: categories.map(function(stat) { return playerJson.values[stat]; }),
+                        theta: categories,
+                        fill: 'toself',
+                        name: 'Player Stats',
+                        fillcolor: 'rgba(59, 130, 246, 0.3)',
+                        line: {color: '#3b82f6', width: 3},
+                        marker: {color: '#3b82f6', size: 8, line: {width: 2, color: 'white'}}
+                    }],
+                    layout: {
+                        polar: {
+                            // Matches the default plotly template the server-side figures use
+                            bgcolor: '#E5ECF6',
+                            radialaxis: {visible: true, range: [0, 1], gridcolor: '#f3f4f6', linecolor: '#e5e7eb', ticks: ''},
+                            angularaxis: {gridcolor: '#f3f4f6', linecolor: '#e5e7eb', ticks: ''}
+                        },
+                        title: {
+                            text: '🎯 Player Performance Radar',
+                            font: {size: 18, family: 'Inter, sans-serif', color: '#1f2937'},
+                            x: 0.5
+                        },
+                        font: {family: 'Inter, sans-serif', color: '#2a3f5f'},
+                        plot_bgcolor: 'rgba(0,0,0,0)',
+                        paper_bgcolor: 'rgba(0,0,0,0)',
+                        showlegend: false
+                    }
+                };
+            }
+        }
+    });
+})();
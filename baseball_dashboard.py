@@ -1,18 +1,343 @@
+import functools
+import os
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, Patch, ClientsideFunction, callback
 import numpy as np
+from flask_caching import Cache
+from numba import njit, vectorize
+from plotly_resampler import FigureResampler
+
+# Figure cache lifetime; REDIS_URL switches the store to Redis so every worker shares hits
+CACHE_TIMEOUT = 3600
+
+# Part of the Parquet cache file name; bump whenever read_csv_data changes the dtypes it produces
+PARQUET_SCHEMA_VERSION = 2
+
+# Points per trend trace sent to the browser before plotly-resampler aggregates
+TREND_SHOWN_SAMPLES = 1500
+
+# Shared by every chart; get_modern_chart_layout only swaps in the title text
+CHART_LAYOUT = {
+    'title': {
+        'font': {'size': 18, 'family': 'Inter, sans-serif', 'color': '#1f2937'},
+        'x': 0.5,
+        'xanchor': 'center'
+    },
+    'font': {'family': 'Inter, sans-serif', 'color': '#374151'},
+    'plot_bgcolor': 'rgba(0,0,0,0)',
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'margin': {'l': 60, 'r': 60, 't': 80, 'b': 60},
+    'xaxis': {
+        'gridcolor': '#f3f4f6',
+        'linecolor': '#e5e7eb',
+        'tickfont': {'color': '#6b7280'}
+    },
+    'yaxis': {
+        'gridcolor': '#f3f4f6',
+        'linecolor': '#e5e7eb',
+        'tickfont': {'color': '#6b7280'}
+    }
+}
+
+# Largest correlation matrix that still gets a value label in every cell
+HEATMAP_TEXT_MAX_COLUMNS = 15
+
+# Narrow dtypes halve the bytes every vectorized callback operation has to touch
+RATE_STAT_DTYPES = {stat: 'float32' for stat in ['AVG', 'OBP', 'SLUG', 'OPS', 'BABIP']}
+COUNT_STATS = ['HR', '2B', '3B', 'RBI', 'SB', 'BB', 'SO']
+
+STAT_OPTIONS = [
+    {'label': '🎯 On Base Percentage (OBP)', 'value': 'OBP'},
+    {'label': '⚾ Batting Average (AVG)', 'value': 'AVG'},
+    {'label': '🍀 BABIP', 'value': 'BABIP'},
+    {'label': '💪 Slugging (SLUG)', 'value': 'SLUG'},
+    {'label': '🔥 OPS', 'value': 'OPS'},
+    {'label': '⚡ Doubles (2B)', 'value': '2B'},
+    {'label': '🚀 Home Runs (HR)', 'value': 'HR'},
+    {'label': '🏃 RBI', 'value': 'RBI'},
+    {'label': '💨 Stolen Bases (SB)', 'value': 'SB'}
+]
+
+OVERVIEW_STATS = [
+    {'stat': 'AVG', 'emoji': '⚾', 'color': '#3b82f6'},
+    {'stat': 'OBP', 'emoji': '🎯', 'color': '#10b981'},
+    {'stat': 'SLUG', 'emoji': '💪', 'color': '#f59e0b'},
+    {'stat': 'OPS', 'emoji': '🔥', 'color': '#ef4444'},
+    {'stat': 'HR', 'emoji': '🚀', 'color': '#8b5cf6'},
+    {'stat': 'RBI', 'emoji': '🏃', 'color': '#06b6d4'}
+]
+
+RADAR_DEFAULT_STATS = ['AVG', 'OBP', 'SLUG', 'OPS']
+# Radar scale per stat: 0 = rate (full at .400), 1 = OPS (full at 1.000), anything else is a count (full at 50)
+RADAR_SCALE_CODES = {'AVG': 0, 'OBP': 0, 'SLUG': 0, 'BABIP': 0, 'OPS': 1}
+RADAR_COUNT_SCALE = 2
+
+TREND_STATS = ['AVG', 'OBP', 'SLUG']
+TREND_HOVERTEMPLATES = {
+    stat: f'<b>{stat}</b><br>Season: %{{x}}<br>Value: %{{y:.3f}}<extra></extra>' for stat in TREND_STATS
+}
+
+@njit(cache=True)
+def group_sums(codes, values, ngroups):
+    """Per-group sums and non-NaN counts of each column in a 2-D float array"""
+    sums = np.zeros((ngroups, values.shape[1]))
+    counts = np.zeros((ngroups, values.shape[1]))
+    for i in range(values.shape[0]):
+        group = codes[i]
+        if group < 0:
+            continue
+        for j in range(values.shape[1]):
+            value = values[i, j]
+            if not np.isnan(value):
+                sums[group, j] += value
+                counts[group, j] += 1
+    return sums, counts
+
+@njit(cache=True, fastmath=True)
+def compute_xbh(hits, out):
+    """Row sums of a NaN-free 2-D float32 block of 2B/3B/HR columns into out"""
+    for i in range(out.shape[0]):
+        total = np.float32(0.0)
+        for j in range(hits.shape[1]):
+            total += hits[i, j]
+        out[i] = total
+    return out
+
+@vectorize(['float32(float32, int8)'], cache=True)
+def normalize_radar(value, scale_code):
+    """Scale a stat onto the radar's 0-1 axis according to its RADAR_SCALE_CODES entry"""
+    if scale_code == 0:
+        return min(value / np.float32(0.400), np.float32(1.0))
+    if scale_code == 1:
+        return min(value / np.float32(1.000), np.float32(1.0))
+    return min(value / np.float32(50.0), np.float32(1.0))
 
 class BaseballDashboard:
     def __init__(self, csv_file_path):
-        self.df = pd.read_csv(csv_file_path)
+        self.df = self.load_data(csv_file_path)
+        # Stable across processes, unlike repr(self), so shared cache entries match between workers
+        self._caching_id = f"{os.path.abspath(csv_file_path)}@{os.path.getmtime(csv_file_path)}"
+        self.build_indexes()
+        # Bound per instance so the caches live and die with the dashboard
+        self.get_cached_player_data = functools.lru_cache(maxsize=256)(self.slice_player_data)
+        self.get_league_means = functools.lru_cache(maxsize=64)(self.compute_league_means)
+        self.get_player_means = functools.lru_cache(maxsize=256)(self.compute_player_means)
+        self.get_stats_overview = functools.lru_cache(maxsize=256)(self.build_stats_overview)
+        self.get_radar_values = functools.lru_cache(maxsize=128)(self.build_radar_values)
         self.app = dash.Dash(__name__)
+        
+        # Figures only depend on (player, season_lo, season_hi[, stats]) and are memoized as plain dicts
+        self.cache = Cache(self.app.server, config=self.get_cache_config())
+        self.get_batting_trend_figure = self.cache.memoize()(self.build_batting_trend_figure)
+        self.get_power_stats_figure = self.cache.memoize()(self.build_power_stats_figure)
+        self.get_comparison_chart_figure = self.cache.memoize()(self.build_comparison_chart_figure)
+        self.get_correlation_heatmap_figure = self.cache.memoize()(self.build_correlation_heatmap_figure)
         self.setup_layout()
         self.setup_callbacks()
     
+    def __caching_id__(self):
+        return self._caching_id
+    
+    def get_cache_config(self):
+        """Redis when REDIS_URL is set, otherwise an in-process cache"""
+        redis_url = os.environ.get('REDIS_URL')
+        if redis_url:
+            return {'CACHE_TYPE': 'RedisCache', 'CACHE_REDIS_URL': redis_url, 'CACHE_DEFAULT_TIMEOUT': CACHE_TIMEOUT}
+        return {'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': CACHE_TIMEOUT}
+    
+    def load_data(self, csv_file_path):
+        """Load from a Parquet copy of the CSV, rebuilding it whenever the CSV is newer or unreadable"""
+        parquet_path = f"{os.path.splitext(csv_file_path)[0]}.v{PARQUET_SCHEMA_VERSION}.parquet"
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_file_path):
+            try:
+                return pd.read_parquet(parquet_path)
+            except (OSError, ValueError):
+                pass  # Corrupt or foreign file: fall through and replace it from the CSV
+        
+        df = self.read_csv_data(csv_file_path)
+        self.write_parquet_cache(df, parquet_path)
+        return df
+    
+    def write_parquet_cache(self, df, parquet_path):
+        """Write to a temp file beside the cache and swap it in, so readers never see a partial file"""
+        tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, parquet_path)
+        except OSError:
+            # Read-only data directory: the CSV is simply parsed again on the next start
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def read_csv_data(self, csv_file_path):
+        """Read the CSV with the pyarrow parser and narrow every column to the smallest safe dtype"""
+        df = pd.read_csv(csv_file_path, engine='pyarrow', dtype=RATE_STAT_DTYPES)
+        
+        # Categorical players compare and group by integer codes; ordered, so the sorted names
+        # in cat.categories are the dropdown order and code order matches name order
+        if 'Player' in df.columns:
+            df['Player'] = pd.Categorical(df['Player'], ordered=True)
+        if 'Season' in df.columns:
+            df['Season'] = df['Season'].astype('int16')
+        # Counting stats only become integers when no value is missing
+        for stat in COUNT_STATS:
+            if stat in df.columns:
+                df[stat] = df[stat].astype('int16' if df[stat].notna().all() else 'float32')
+        return df
+    
+    def build_indexes(self):
+        """Precompute sorted per-player and per-season views used by the callbacks"""
+        self._players = self.df['Player'].cat.categories.tolist() if 'Player' in self.df.columns else sorted(self.df.index)
+        self._player_options = [{'label': f"⭐ {player}", 'value': player} for player in self._players]
+        
+        # self.df is read-only from here on: Player-major, Season-minor, so every player's rows are
+        # one contiguous run and the per-player frames below are row slices sharing its memory
+        sort_columns = [col for col in ['Player', 'Season'] if col in self.df.columns]
+        if sort_columns:
+            self.df = self.df.sort_values(sort_columns, kind='mergesort').reset_index(drop=True)
+        self._season_index = self.df['Season'].to_numpy() if 'Season' in self.df.columns else None
+        
+        if 'Player' in self.df.columns:
+            positions = self.df.groupby('Player', sort=False, observed=True).indices
+            self._player_rows = {player: (rows[0], rows[-1] + 1) for player, rows in positions.items()}
+            self._by_player = {player: self.df.iloc[start:stop] for player, (start, stop) in self._player_rows.items()}
+        else:
+            self._player_rows = {None: (0, len(self.df))}
+            self._by_player = None
+        # Groups are Season-sorted, so each one's last row is the player's latest season; kept as plain
+        # dicts so callbacks read scalars without indexing a Series
+        self._latest_by_player = ({player: group.iloc[-1].to_dict() for player, group in self._by_player.items()}
+                                  if self._by_player is not None else {})
+        
+        # The schema is fixed after load, so column selections are resolved once here
+        self._numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        self._stat_options = [option for option in STAT_OPTIONS if option['value'] in self._numeric_cols]
+        self._overview_stats = [info for info in OVERVIEW_STATS if info['stat'] in self._numeric_cols]
+        self._radar_stats = [stat for stat in dict.fromkeys([option['value'] for option in self._stat_options] + RADAR_DEFAULT_STATS)
+                             if stat in self._numeric_cols]
+        self._radar_scale_codes = np.array([RADAR_SCALE_CODES.get(stat, RADAR_COUNT_SCALE) for stat in self._radar_stats],
+                                           dtype=np.int8)
+        # One float32 copy of the numeric columns; each player's (seasons, values) block is a row-slice
+        # view into it, so the heatmap only slices rows
+        numeric_block = np.ascontiguousarray(self.df[self._numeric_cols].to_numpy(dtype=np.float32))
+        self._numeric_blocks = {
+            player: (self._season_index[start:stop] if self._season_index is not None else None,
+                     numeric_block[start:stop])
+            for player, (start, stop) in self._player_rows.items()
+        }
+        # Whole-career matrices are window-independent, so the default slider position does no math
+        self._full_correlation = {player: self.correlate_block(block)
+                                  for player, (_, block) in self._numeric_blocks.items()}
+        self._league_mean = self.df[self._numeric_cols].mean()
+        if self._season_index is not None:
+            # Running per-season sums and counts turn any season window's league mean into two row differences
+            by_season = self.df[self._numeric_cols].groupby(self._season_index, sort=True)
+            season_sums, season_counts = by_season.sum(), by_season.count()
+            self._league_seasons = season_sums.index.to_numpy()
+            zero_row = np.zeros((1, len(self._numeric_cols)))
+            self._league_sum_prefix = np.vstack([zero_row, season_sums.to_numpy(dtype=np.float64).cumsum(axis=0)])
+            self._league_count_prefix = np.vstack([zero_row, season_counts.to_numpy(dtype=np.float64).cumsum(axis=0)])
+        if 'Player' in self.df.columns:
+            # Category codes are already dense group ids, so the kernel needs no factorize pass
+            self._code_of = {player: code for code, player in enumerate(self._players)}
+            codes = self.df['Player'].cat.codes.to_numpy()
+            values = self.df[self._numeric_cols].to_numpy(dtype=np.float64)
+            sums, counts = group_sums(codes, values, len(self._players))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                self._player_mean = pd.DataFrame(sums / counts, index=self._players, columns=self._numeric_cols)
+        else:
+            self._code_of = None
+            self._player_mean = None
+    
+    def covers_all_seasons(self, season_lo, season_hi):
+        """Whether a season window includes every season in the data"""
+        return self._season_index is None or (season_lo <= self._league_seasons[0] and season_hi >= self._league_seasons[-1])
+    
+    def compute_league_means(self, season_lo, season_hi):
+        """League mean of every numeric column over a season window, from the running sums"""
+        if self.covers_all_seasons(season_lo, season_hi):
+            return self._league_mean
+        
+        lo = np.searchsorted(self._league_seasons, season_lo, side='left')
+        hi = np.searchsorted(self._league_seasons, season_hi, side='right')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = ((self._league_sum_prefix[hi] - self._league_sum_prefix[lo]) /
+                     (self._league_count_prefix[hi] - self._league_count_prefix[lo]))
+        return pd.Series(means, index=self._numeric_cols)
+    
+    def compute_player_means(self, selected_player, season_lo, season_hi):
+        """Player mean of every numeric column, read from the precomputed table for the full range"""
+        if self._player_mean is None:
+            return self.compute_league_means(season_lo, season_hi)
+        if not self.covers_all_seasons(season_lo, season_hi):
+            player_data = self.get_player_data(selected_player, (season_lo, season_hi))
+            return player_data[self._numeric_cols].mean()
+        
+        code = self._code_of.get(selected_player)
+        if code is None:
+            return pd.Series(np.nan, index=self._numeric_cols)
+        return self._player_mean.iloc[code]
+    
+    def season_bounds(self, seasons, season_range):
+        """Row bounds of the season range in a sorted Season array"""
+        if seasons is None:
+            return 0, None
+        return (np.searchsorted(seasons, season_range[0], side='left'),
+                np.searchsorted(seasons, season_range[1], side='right'))
+    
+    def slice_seasons(self, frame, seasons, season_range):
+        """Slice a Season-sorted frame to the selected range without a boolean mask"""
+        lo, hi = self.season_bounds(seasons, season_range)
+        return frame.iloc[lo:hi]
+    
+    def slice_player_data(self, selected_player, season_lo, season_hi):
+        """Look up the pre-split frame for a player and slice it to the season range"""
+        if self._by_player is None:
+            return self.slice_seasons(self.df, self._season_index, (season_lo, season_hi))
+        
+        player_df = self._by_player.get(selected_player, self.df.iloc[0:0])
+        seasons = player_df['Season'].to_numpy() if 'Season' in player_df.columns else None
+        return self.slice_seasons(player_df, seasons, (season_lo, season_hi))
+    
+    def get_player_data(self, selected_player, season_range):
+        """Player slice shared by every chart callback for the same filters"""
+        return self.get_cached_player_data(selected_player, season_range[0], season_range[1])
+    
+    def get_latest_stats(self, selected_player, player_data, season_range):
+        """Latest season row of the slice as a dict, precomputed when the range reaches the player's last season"""
+        latest = self._latest_by_player.get(selected_player)
+        if latest is not None and ('Season' not in latest or season_range[1] >= latest['Season']):
+            return latest
+        return player_data.iloc[-1].to_dict()
+    
+    def compute_correlation(self, selected_player, season_lo, season_hi):
+        """Correlation matrix of the numeric columns for a player and season range"""
+        key = selected_player if self._by_player is not None else None
+        if key not in self._numeric_blocks:
+            return np.full((len(self._numeric_cols), len(self._numeric_cols)), np.nan)
+        
+        seasons, block = self._numeric_blocks[key]
+        lo, hi = self.season_bounds(seasons, (season_lo, season_hi))
+        if lo == 0 and (hi is None or hi == len(block)):
+            return self._full_correlation[key]
+        return self.correlate_block(block[lo:hi])
+    
+    def correlate_block(self, values):
+        """Correlation matrix of a float32 numeric block, pairwise-complete like DataFrame.corr"""
+        if np.isnan(values).any():
+            # Each pair keeps every row where both stats exist; dropping whole rows would let one
+            # missing stat distort unrelated cells of a player's few seasons
+            return pd.DataFrame(values).corr().to_numpy()
+        if len(values) < 2:
+            return np.full((len(self._numeric_cols), len(self._numeric_cols)), np.nan)
+        
+        # Constant columns have no variance and come back as NaN, as with DataFrame.corr
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.corrcoef(values, rowvar=False)
+    
     def get_modern_theme(self):
         """Define modern color theme and styling"""
         return {
@@ -30,107 +355,14 @@ class BaseballDashboard:
     
     def setup_layout(self):
         theme = self.get_modern_theme()
-        players = sorted(self.df['Player'].unique()) if 'Player' in self.df.columns else sorted(self.df.index)
+        players = self._players
         
         self.app.layout = html.Div([
-            # Custom CSS
-            html.Div([
-                html.Style("""
-                    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-                    
-                    * {
-                        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-                    }
-                    
-                    body {
-                        margin: 0;
-                        padding: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        min-height: 100vh;
-                    }
-                    
-                    .main-container {
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        min-height: 100vh;
-                        padding: 20px;
-                    }
-                    
-                    .content-wrapper {
-                        max-width: 1400px;
-                        margin: 0 auto;
-                        background: rgba(255, 255, 255, 0.95);
-                        border-radius: 20px;
-                        padding: 30px;
-                        box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-                        backdrop-filter: blur(10px);
-                    }
-                    
-                    .control-card {
-                        background: linear-gradient(145deg, #ffffff, #f1f5f9);
-                        border-radius: 15px;
-                        padding: 20px;
-                        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-                        border: 1px solid rgba(255, 255, 255, 0.2);
-                        transition: all 0.3s ease;
-                    }
-                    
-                    .control-card:hover {
-                        transform: translateY(-2px);
-                        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-                    }
-                    
-                    .stat-card {
-                        background: linear-gradient(145deg, #ffffff, #f8fafc);
-                        border-radius: 15px;
-                        padding: 25px;
-                        margin: 8px;
-                        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.5);
-                        transition: all 0.3s ease;
-                        position: relative;
-                        overflow: hidden;
-                    }
-                    
-                    .stat-card::before {
-                        content: '';
-                        position: absolute;
-                        top: 0;
-                        left: 0;
-                        right: 0;
-                        height: 4px;
-                        background: linear-gradient(90deg, #3b82f6, #10b981);
-                    }
-                    
-                    .stat-card:hover {
-                        transform: translateY(-5px);
-                        box-shadow: 0 12px 30px rgba(0, 0, 0, 0.15);
-                    }
-                    
-                    .chart-container {
-                        background: linear-gradient(145deg, #ffffff, #f8fafc);
-                        border-radius: 15px;
-                        padding: 20px;
-                        margin: 10px;
-                        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.5);
-                        transition: all 0.3s ease;
-                    }
-                    
-                    .chart-container:hover {
-                        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.12);
-                    }
-                    
-                    .Select-control {
-                        border-radius: 10px !important;
-                        border: 2px solid #e5e7eb !important;
-                        transition: all 0.3s ease !important;
-                    }
-                    
-                    .Select-control:hover {
-                        border-color: #3b82f6 !important;
-                    }
-                """)
-            ]),
+            # Trace structure last sent to the patched charts
+            dcc.Store(id='batting-trend-mode'),
+            dcc.Store(id='power-stats-mode'),
+            # Normalized radar values for the current player and season range
+            dcc.Store(id='player-json'),
             
             # Main container
             html.Div([
@@ -166,7 +398,7 @@ class BaseballDashboard:
                                      style={'fontSize': '1.1rem', 'fontWeight': '600', 'color': theme['text_primary'], 'marginBottom': '10px', 'display': 'block'}),
                             dcc.Dropdown(
                                 id='player-dropdown',
-                                options=[{'label': f"⭐ {player}", 'value': player} for player in players],
+                                options=self._player_options,
                                 value=players[0] if players else None,
                                 style={'borderRadius': '10px'},
                                 className='modern-dropdown'
@@ -178,18 +410,8 @@ class BaseballDashboard:
                                      style={'fontSize': '1.1rem', 'fontWeight': '600', 'color': theme['text_primary'], 'marginBottom': '10px', 'display': 'block'}),
                             dcc.Dropdown(
                                 id='stats-dropdown',
-                                options=[
-                                    {'label': '🎯 On Base Percentage (OBP)', 'value': 'OBP'},
-                                    {'label': '⚾ Batting Average (AVG)', 'value': 'AVG'},
-                                    {'label': '🍀 BABIP', 'value': 'BABIP'},
-                                    {'label': '💪 Slugging (SLUG)', 'value': 'SLUG'},
-                                    {'label': '🔥 OPS', 'value': 'OPS'},
-                                    {'label': '⚡ Doubles (2B)', 'value': '2B'},
-                                    {'label': '🚀 Home Runs (HR)', 'value': 'HR'},
-                                    {'label': '🏃 RBI', 'value': 'RBI'},
-                                    {'label': '💨 Stolen Bases (SB)', 'value': 'SB'}
-                                ],
-                                value=['OBP', 'AVG', 'SLUG'],
+                                options=self._stat_options,
+                                value=[stat for stat in ['OBP', 'AVG', 'SLUG'] if stat in self._numeric_cols],
                                 multi=True,
                                 style={'borderRadius': '10px'}
                             )
@@ -259,107 +481,175 @@ class BaseballDashboard:
     
     def get_modern_chart_layout(self, title):
         """Get modern chart layout template"""
-        return {
-            'title': {
-                'text': title,
-                'font': {'size': 18, 'family': 'Inter, sans-serif', 'color': '#1f2937'},
-                'x': 0.5,
-                'xanchor': 'center'
-            },
-            'font': {'family': 'Inter, sans-serif', 'color': '#374151'},
-            'plot_bgcolor': 'rgba(0,0,0,0)',
-            'paper_bgcolor': 'rgba(0,0,0,0)',
-            'margin': {'l': 60, 'r': 60, 't': 80, 'b': 60},
-            'xaxis': {
-                'gridcolor': '#f3f4f6',
-                'linecolor': '#e5e7eb',
-                'tickfont': {'color': '#6b7280'}
-            },
-            'yaxis': {
-                'gridcolor': '#f3f4f6',
-                'linecolor': '#e5e7eb',
-                'tickfont': {'color': '#6b7280'}
-            }
-        }
+        # Callers only add top-level keys, so a shallow copy with a fresh title dict is enough
+        layout = dict(CHART_LAYOUT)
+        layout['title'] = {**CHART_LAYOUT['title'], 'text': title}
+        return layout
+    
+    def get_chart_mode(self, player_data):
+        """Trace structure the trend and power charts use for this slice"""
+        if player_data.empty:
+            return 'empty'
+        return 'trend' if 'Season' in player_data.columns and len(player_data) > 1 else 'single'
+    
+    def patch_figure(self, fig, mode, previous_mode):
+        """Return only the changed trace values when the chart keeps its trace structure"""
+        if mode != previous_mode:
+            return fig, mode
+        
+        patch = Patch()
+        for i, trace in enumerate(fig['data']):
+            patch['data'][i]['x'] = trace.get('x')
+            patch['data'][i]['y'] = trace.get('y')
+            patch['data'][i]['name'] = trace.get('name')
+        return patch, mode
+    
+    def build_stats_overview(self, selected_player, season_lo, season_hi):
+        player_data = self.get_player_data(selected_player, (season_lo, season_hi))
+        return self.create_stats_overview(player_data, selected_player, (season_lo, season_hi))
+    
+    def build_radar_values(self, selected_player, season_lo, season_hi):
+        player_data = self.get_player_data(selected_player, (season_lo, season_hi))
+        return self.create_radar_values(selected_player, player_data, (season_lo, season_hi))
+    
+    def build_batting_trend_figure(self, selected_player, season_lo, season_hi):
+        player_data = self.get_player_data(selected_player, (season_lo, season_hi))
+        return self.create_batting_trend(player_data).to_dict()
+    
+    def build_power_stats_figure(self, selected_player, season_lo, season_hi):
+        player_data = self.get_player_data(selected_player, (season_lo, season_hi))
+        return self.create_power_stats(player_data).to_dict()
+    
+    def build_comparison_chart_figure(self, selected_player, season_lo, season_hi, selected_stats):
+        # Stats arrive as a tuple for the cache key; their order is the bar order, so it is kept
+        return self.create_comparison_chart(selected_player, (season_lo, season_hi), list(selected_stats)).to_dict()
+    
+    def build_correlation_heatmap_figure(self, selected_player, season_lo, season_hi):
+        return self.create_correlation_heatmap(selected_player, (season_lo, season_hi)).to_dict()
     
     def setup_callbacks(self):
         @self.app.callback(
-            [Output('player-stats-overview', 'children'),
-             Output('batting-average-trend', 'figure'),
-             Output('power-stats-chart', 'figure'),
-             Output('radar-chart', 'figure'),
-             Output('comparison-chart', 'figure'),
-             Output('correlation-heatmap', 'figure')],
+            Output('player-stats-overview', 'children'),
+            [Input('player-dropdown', 'value'),
+             Input('season-slider', 'value')]
+        )
+        def update_stats_overview(selected_player, season_range):
+            return self.get_stats_overview(selected_player, season_range[0], season_range[1])
+        
+        @self.app.callback(
+            [Output('batting-average-trend', 'figure'),
+             Output('batting-trend-mode', 'data')],
+            [Input('player-dropdown', 'value'),
+             Input('season-slider', 'value')],
+            [State('batting-trend-mode', 'data')]
+        )
+        def update_batting_trend(selected_player, season_range, previous_mode):
+            player_data = self.get_player_data(selected_player, season_range)
+            fig = self.get_batting_trend_figure(selected_player, season_range[0], season_range[1])
+            return self.patch_figure(fig, self.get_chart_mode(player_data), previous_mode)
+        
+        @self.app.callback(
+            Output('batting-average-trend', 'figure', allow_duplicate=True),
+            Input('batting-average-trend', 'relayoutData'),
+            [State('player-dropdown', 'value'),
+             State('season-slider', 'value')],
+            prevent_initial_call=True
+        )
+        def resample_batting_trend(relayout_data, selected_player, season_range):
+            # Only x-axis zoom/pan/autorange events change what is resampled; autosize and the
+            # single-season bar chart never need the figure rebuilt
+            if not relayout_data or not any(key.startswith('xaxis') for key in relayout_data):
+                return dash.no_update
+            player_data = self.get_player_data(selected_player, season_range)
+            if self.get_chart_mode(player_data) != 'trend':
+                return dash.no_update
+            # Rebuilt from the current filters so no per-session figure lives on the server
+            fig = self.create_batting_trend(player_data)
+            return fig.construct_update_data_patch(relayout_data)
+        
+        @self.app.callback(
+            [Output('power-stats-chart', 'figure'),
+             Output('power-stats-mode', 'data')],
+            [Input('player-dropdown', 'value'),
+             Input('season-slider', 'value')],
+            [State('power-stats-mode', 'data')]
+        )
+        def update_power_stats(selected_player, season_range, previous_mode):
+            player_data = self.get_player_data(selected_player, season_range)
+            fig = self.get_power_stats_figure(selected_player, season_range[0], season_range[1])
+            return self.patch_figure(fig, self.get_chart_mode(player_data), previous_mode)
+        
+        @self.app.callback(
+            Output('player-json', 'data'),
+            [Input('player-dropdown', 'value'),
+             Input('season-slider', 'value')]
+        )
+        def update_radar_values(selected_player, season_range):
+            return self.get_radar_values(selected_player, season_range[0], season_range[1])
+        
+        # The radar figure is built in the browser, so the stats dropdown never reaches the server for it
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='radar', function_name='build'),
+            Output('radar-chart', 'figure'),
+            [Input('player-json', 'data'),
+             Input('stats-dropdown', 'value')]
+        )
+        
+        @self.app.callback(
+            Output('comparison-chart', 'figure'),
             [Input('player-dropdown', 'value'),
              Input('stats-dropdown', 'value'),
              Input('season-slider', 'value')]
         )
-        def update_dashboard(selected_player, selected_stats, season_range):
-            filtered_df = self.df.copy()
-            if 'Season' in filtered_df.columns:
-                filtered_df = filtered_df[
-                    (filtered_df['Season'] >= season_range[0]) & 
-                    (filtered_df['Season'] <= season_range[1])
-                ]
-            
-            player_data = filtered_df[filtered_df['Player'] == selected_player] if 'Player' in filtered_df.columns else filtered_df
-            
-            overview = self.create_stats_overview(player_data, selected_player)
-            trend_fig = self.create_batting_trend(player_data)
-            power_fig = self.create_power_stats(player_data)
-            radar_fig = self.create_radar_chart(player_data, selected_stats)
-            comparison_fig = self.create_comparison_chart(filtered_df, selected_player, selected_stats)
-            heatmap_fig = self.create_correlation_heatmap(player_data)
-            
-            return overview, trend_fig, power_fig, radar_fig, comparison_fig, heatmap_fig
+        def update_comparison_chart(selected_player, selected_stats, season_range):
+            return self.get_comparison_chart_figure(selected_player, season_range[0], season_range[1],
+                                                    tuple(selected_stats or ()))
+        
+        @self.app.callback(
+            Output('correlation-heatmap', 'figure'),
+            [Input('player-dropdown', 'value'),
+             Input('season-slider', 'value')]
+        )
+        def update_correlation_heatmap(selected_player, season_range):
+            return self.get_correlation_heatmap_figure(selected_player, season_range[0], season_range[1])
     
-    def create_stats_overview(self, player_data, player_name):
+    def create_stats_overview(self, player_data, player_name, season_range):
         if player_data.empty:
             return html.Div("No data available for selected filters")
         
-        latest_stats = player_data.iloc[-1] if len(player_data) > 0 else player_data.iloc[0]
-        
-        stats_info = [
-            {'stat': 'AVG', 'emoji': '⚾', 'color': '#3b82f6'},
-            {'stat': 'OBP', 'emoji': '🎯', 'color': '#10b981'},
-            {'stat': 'SLUG', 'emoji': '💪', 'color': '#f59e0b'},
-            {'stat': 'OPS', 'emoji': '🔥', 'color': '#ef4444'},
-            {'stat': 'HR', 'emoji': '🚀', 'color': '#8b5cf6'},
-            {'stat': 'RBI', 'emoji': '🏃', 'color': '#06b6d4'}
-        ]
+        latest_stats = self.get_latest_stats(player_name, player_data, season_range)
         
         stats_cards = []
-        for info in stats_info:
-            if info['stat'] in latest_stats:
-                value = latest_stats[info['stat']]
-                formatted_value = f"{value:.3f}" if isinstance(value, float) and value < 10 else str(int(value))
-                
-                stats_cards.append(
+        for info in self._overview_stats:
+            value = latest_stats[info['stat']]
+            formatted_value = f"{value:.3f}" if isinstance(value, (float, np.floating)) and value < 10 else str(int(value))
+            
+            stats_cards.append(
+                html.Div([
                     html.Div([
-                        html.Div([
-                            html.Span(info['emoji'], style={'fontSize': '2rem', 'marginBottom': '10px', 'display': 'block'}),
-                            html.H3(formatted_value, style={
-                                'fontSize': '2rem',
-                                'fontWeight': '700',
-                                'margin': '0',
-                                'color': info['color']
-                            }),
-                            html.P(info['stat'], style={
-                                'fontSize': '0.9rem',
-                                'fontWeight': '600',
-                                'margin': '8px 0 0 0',
-                                'color': '#6b7280',
-                                'textTransform': 'uppercase',
-                                'letterSpacing': '1px'
-                            })
-                        ])
-                    ], className='stat-card', style={
-                        'width': '15%',
-                        'display': 'inline-block',
-                        'textAlign': 'center',
-                        'verticalAlign': 'top'
-                    })
-                )
+                        html.Span(info['emoji'], style={'fontSize': '2rem', 'marginBottom': '10px', 'display': 'block'}),
+                        html.H3(formatted_value, style={
+                            'fontSize': '2rem',
+                            'fontWeight': '700',
+                            'margin': '0',
+                            'color': info['color']
+                        }),
+                        html.P(info['stat'], style={
+                            'fontSize': '0.9rem',
+                            'fontWeight': '600',
+                            'margin': '8px 0 0 0',
+                            'color': '#6b7280',
+                            'textTransform': 'uppercase',
+                            'letterSpacing': '1px'
+                        })
+                    ])
+                ], className='stat-card', style={
+                    'width': '15%',
+                    'display': 'inline-block',
+                    'textAlign': 'center',
+                    'verticalAlign': 'top'
+                })
+            )
         
         return html.Div([
             html.Div([
@@ -379,26 +669,32 @@ class BaseballDashboard:
         ])
     
     def create_batting_trend(self, player_data):
-        fig = go.Figure()
+        if player_data.empty:
+            fig = go.Figure()
+            fig.add_annotation(text="No data available", showarrow=False, font={'size': 16, 'color': '#6b7280'})
+            return fig
+        
         colors = ['#3b82f6', '#10b981', '#f59e0b']
         
         if 'Season' in player_data.columns and len(player_data) > 1:
-            for i, stat in enumerate(['AVG', 'OBP', 'SLUG']):
+            # Only the points visible at the current zoom level are sent to the browser
+            fig = FigureResampler(go.Figure(), default_n_shown_samples=TREND_SHOWN_SAMPLES)
+            # One Season array shared by every trace instead of one extraction per stat
+            seasons = player_data['Season'].to_numpy()
+            for i, stat in enumerate(TREND_STATS):
                 if stat in player_data.columns:
-                    fig.add_trace(go.Scatter(
-                        x=player_data['Season'],
-                        y=player_data[stat],
+                    fig.add_trace(go.Scattergl(
                         mode='lines+markers',
                         name=stat,
                         line=dict(width=4, color=colors[i]),
                         marker=dict(size=8, color=colors[i], line=dict(width=2, color='white')),
-                        hovertemplate=f'<b>{stat}</b><br>Season: %{{x}}<br>Value: %{{y:.3f}}<extra></extra>'
-                    ))
+                        hovertemplate=TREND_HOVERTEMPLATES[stat]
+                    ), hf_x=seasons, hf_y=player_data[stat].to_numpy())
         else:
-            stats = ['AVG', 'OBP', 'SLUG']
-            values = [player_data[stat].iloc[0] if stat in player_data.columns else 0 for stat in stats]
+            fig = go.Figure()
+            values = [player_data[stat].iloc[0] if stat in player_data.columns else 0 for stat in TREND_STATS]
             fig.add_trace(go.Bar(
-                x=stats, 
+                x=TREND_STATS, 
                 y=values, 
                 name='Current Stats',
                 marker=dict(color=colors, opacity=0.8, line=dict(width=2, color='white'))
@@ -410,7 +706,16 @@ class BaseballDashboard:
         return fig
     
     def create_power_stats(self, player_data):
+        if player_data.empty:
+            fig = go.Figure()
+            fig.add_annotation(text="No data available", showarrow=False, font={'size': 16, 'color': '#6b7280'})
+            return fig
+        
         fig = make_subplots(rows=1, cols=2, subplot_titles=('🚀 Home Runs', '⚡ Extra Base Hits'))
+        xbh_columns = [col for col in ['2B', '3B', 'HR'] if col in player_data.columns]
+        # Missing hits count as zero; na_value fills them during the single float32 conversion
+        hits = player_data[xbh_columns].to_numpy(dtype=np.float32, na_value=0.0)
+        extra_base = compute_xbh(hits, np.empty(len(player_data), dtype=np.float32))
         
         if 'Season' in player_data.columns and len(player_data) > 1:
             if 'HR' in player_data.columns:
@@ -421,14 +726,6 @@ class BaseballDashboard:
                     marker=dict(color='#ef4444', opacity=0.8, line=dict(width=2, color='white'))
                 ), row=1, col=1)
             
-            extra_base = []
-            for _, row in player_data.iterrows():
-                xbh = 0
-                if '2B' in row: xbh += row['2B'] if pd.notna(row['2B']) else 0
-                if '3B' in row: xbh += row['3B'] if pd.notna(row['3B']) else 0
-                if 'HR' in row: xbh += row['HR'] if pd.notna(row['HR']) else 0
-                extra_base.append(xbh)
-            
             fig.add_trace(go.Bar(
                 x=player_data['Season'],
                 y=extra_base,
@@ -443,13 +740,9 @@ class BaseballDashboard:
                 marker=dict(color='#ef4444', opacity=0.8, line=dict(width=2, color='white'))
             ), row=1, col=1)
             
-            xbh_val = 0
-            if '2B' in player_data.columns: xbh_val += player_data['2B'].iloc[0] or 0
-            if '3B' in player_data.columns: xbh_val += player_data['3B'].iloc[0] or 0
-            if 'HR' in player_data.columns: xbh_val += player_data['HR'].iloc[0] or 0
             fig.add_trace(go.Bar(
                 x=['XBH'], 
-                y=[xbh_val], 
+                y=extra_base[:1], 
                 marker=dict(color='#3b82f6', opacity=0.8, line=dict(width=2, color='white'))
             ), row=1, col=2)
         
@@ -459,79 +752,35 @@ class BaseballDashboard:
         
         return fig
     
-    def create_radar_chart(self, player_data, selected_stats):
+    def create_radar_values(self, selected_player, player_data, season_range):
+        """Normalized latest-season value of every radar stat; assets/radar.js draws the selected ones"""
         if player_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(text="No data available", showarrow=False, font={'size': 16, 'color': '#6b7280'})
-            return fig
-        
-        latest_data = player_data.iloc[-1]
-        radar_stats = selected_stats if selected_stats else ['AVG', 'OBP', 'SLUG', 'OPS']
+            return None
         
-        values = []
-        categories = []
+        latest_data = self.get_latest_stats(selected_player, player_data, season_range)
+        raw = np.array([latest_data[stat] for stat in self._radar_stats], dtype=np.float32)
+        with np.errstate(invalid='ignore'):
+            normalized = normalize_radar(raw, self._radar_scale_codes)
+        values = {stat: float(value) for stat, value, present in zip(self._radar_stats, normalized, ~np.isnan(raw))
+                  if present}
         
-        for stat in radar_stats:
-            if stat in latest_data and pd.notna(latest_data[stat]):
-                if stat in ['AVG', 'OBP', 'SLUG', 'BABIP']:
-                    normalized_val = min(latest_data[stat] / 0.400, 1.0)
-                elif stat == 'OPS':
-                    normalized_val = min(latest_data[stat] / 1.000, 1.0)
-                else:
-                    normalized_val = min(latest_data[stat] / 50, 1.0)
-                
-                values.append(normalized_val)
-                categories.append(stat)
-        
-        if values:
-            fig = go.Figure(data=go.Scatterpolar(
-                r=values,
-                theta=categories,
-                fill='toself',
-                name='Player Stats',
-                fillcolor='rgba(59, 130, 246, 0.3)',
-                line=dict(color='#3b82f6', width=3),
-                marker=dict(color='#3b82f6', size=8, line=dict(width=2, color='white'))
-            ))
-            
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 1],
-                        gridcolor='#f3f4f6',
-                        linecolor='#e5e7eb'
-                    ),
-                    angularaxis=dict(
-                        gridcolor='#f3f4f6',
-                        linecolor='#e5e7eb'
-                    )
-                ),
-                title={
-                    'text': '🎯 Player Performance Radar',
-                    'font': {'size': 18, 'family': 'Inter, sans-serif', 'color': '#1f2937'},
-                    'x': 0.5
-                },
-                font={'family': 'Inter, sans-serif'},
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False
-            )
-        else:
-            fig = go.Figure()
-            fig.add_annotation(text="No valid stats for radar chart", showarrow=False)
-        
-        return fig
+        return {'values': values, 'defaultStats': RADAR_DEFAULT_STATS}
     
-    def create_comparison_chart(self, full_df, selected_player, selected_stats):
+    def format_bar_labels(self, values):
+        """Format bar labels in one pass: rates to three decimals, counts as whole numbers"""
+        values = np.asarray(values, dtype=np.float64)
+        return np.where(values < 10, np.char.mod('%.3f', values), np.char.mod('%.0f', values))
+    
+    def create_comparison_chart(self, selected_player, season_range, selected_stats):
         if not selected_stats:
             fig = go.Figure()
             fig.add_annotation(text="Select stats to compare", showarrow=False, font={'size': 16, 'color': '#6b7280'})
             return fig
         
-        league_avg = full_df[selected_stats].mean()
-        player_data = full_df[full_df['Player'] == selected_player] if 'Player' in full_df.columns else full_df
-        player_avg = player_data[selected_stats].mean()
+        league_mean = self.get_league_means(season_range[0], season_range[1])
+        player_mean = self.get_player_means(selected_player, season_range[0], season_range[1])
+        league_avg = league_mean[selected_stats]
+        player_avg = player_mean[selected_stats]
         
         fig = go.Figure(data=[
             go.Bar(
@@ -539,7 +788,7 @@ class BaseballDashboard:
                 x=selected_stats, 
                 y=league_avg,
                 marker=dict(color='#94a3b8', opacity=0.7, line=dict(width=2, color='white')),
-                text=[f'{val:.3f}' if val < 10 else f'{val:.0f}' for val in league_avg],
+                text=self.format_bar_labels(league_avg),
                 textposition='auto'
             ),
             go.Bar(
@@ -547,7 +796,7 @@ class BaseballDashboard:
                 x=selected_stats, 
                 y=player_avg,
                 marker=dict(color='#3b82f6', opacity=0.8, line=dict(width=2, color='white')),
-                text=[f'{val:.3f}' if val < 10 else f'{val:.0f}' for val in player_avg],
+                text=self.format_bar_labels(player_avg),
                 textposition='auto'
             )
         ])
@@ -565,17 +814,19 @@ class BaseballDashboard:
         
         return fig
     
-    def create_correlation_heatmap(self, player_data):
-        numeric_columns = player_data.select_dtypes(include=[np.number]).columns
-        correlation_data = player_data[numeric_columns].corr()
+    def create_correlation_heatmap(self, selected_player, season_range):
+        correlation_data = self.compute_correlation(selected_player, season_range[0], season_range[1])
         
-        fig = px.imshow(
-            correlation_data,
-            title="🔥 Statistics Correlation Heatmap",
-            color_continuous_scale='RdBu',
-            aspect='auto',
-            text_auto='.2f'
-        )
+        fig = go.Figure(go.Heatmap(
+            z=correlation_data,
+            x=self._numeric_cols,
+            y=self._numeric_cols,
+            colorscale='RdBu',
+            zmid=0
+        ))
+        # Per-cell labels are K² text nodes in the browser, so only draw them for small matrices
+        if len(self._numeric_cols) <= HEATMAP_TEXT_MAX_COLUMNS:
+            fig.update_traces(texttemplate='%{z:.2f}')
         
         fig.update_layout(
             title={
@@ -586,7 +837,8 @@ class BaseballDashboard:
             font={'family': 'Inter, sans-serif'},
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 80, 'r': 80, 't': 80, 'b': 80}
+            margin={'l': 80, 'r': 80, 't': 80, 'b': 80},
+            yaxis={'autorange': 'reversed'}
         )
         
         return fig
@@ -595,36 +847,33 @@ class BaseballDashboard:
         self.app.run(debug=debug, port=port)
 
 # Sample data generator for testing
-def generate_sample_data():
+def generate_sample_data(seed=None):
     """Generate sample baseball data for testing"""
-    import random
+    rng = np.random.default_rng(seed)
     
     players = ['Mike Trout', 'Mookie Betts', 'Juan Soto', 'Aaron Judge', 'Vladimir Guerrero Jr.']
     seasons = [2021, 2022, 2023]
+    n = len(players) * len(seasons)
     
-    data = []
-    for player in players:
-        for season in seasons:
-            data.append({
-                'Player': player,
-                'Season': season,
-                'AVG': round(random.uniform(0.250, 0.350), 3),
-                'OBP': round(random.uniform(0.300, 0.450), 3),
-                'SLUG': round(random.uniform(0.400, 0.650), 3),
-                'OPS': round(random.uniform(0.700, 1.100), 3),
-                'BABIP': round(random.uniform(0.250, 0.400), 3),
-                'HR': random.randint(15, 50),
-                '2B': random.randint(20, 45),
-                '3B': random.randint(0, 8),
-                'RBI': random.randint(60, 130),
-                'SB': random.randint(0, 25),
-                'BB': random.randint(40, 120),
-                'SO': random.randint(80, 200)
-            })
-    
-    df = pd.DataFrame(data)
-    df['OPS'] = df['OBP'] + df['SLUG']  # Recalculate OPS to be accurate
-    return df
+    # One batch per column; integer bounds are inclusive like random.randint
+    obp = np.round(rng.uniform(0.300, 0.450, n), 3)
+    slug = np.round(rng.uniform(0.400, 0.650, n), 3)
+    return pd.DataFrame({
+        'Player': np.repeat(players, len(seasons)),
+        'Season': np.tile(seasons, len(players)),
+        'AVG': np.round(rng.uniform(0.250, 0.350, n), 3),
+        'OBP': obp,
+        'SLUG': slug,
+        'OPS': obp + slug,  # OPS is derived so it stays consistent with OBP and SLUG
+        'BABIP': np.round(rng.uniform(0.250, 0.400, n), 3),
+        'HR': rng.integers(15, 50, n, endpoint=True),
+        '2B': rng.integers(20, 45, n, endpoint=True),
+        '3B': rng.integers(0, 8, n, endpoint=True),
+        'RBI': rng.integers(60, 130, n, endpoint=True),
+        'SB': rng.integers(0, 25, n, endpoint=True),
+        'BB': rng.integers(40, 120, n, endpoint=True),
+        'SO': rng.integers(80, 200, n, endpoint=True)
+    })
 
 # Usage example
 if __name__ == "__main__":